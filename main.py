@@ -1,12 +1,22 @@
 from urllib.parse import urljoin
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from lxml import etree
+from selectolax.lexbor import LexborHTMLParser
 from tqdm import tqdm
 import time
+from datetime import timedelta
 import re
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import os
+import orjson
+from io import BytesIO
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from datasets import Dataset, DatasetDict, load_dataset
 from huggingface_hub import login, create_repo, HfApi # Import login and HfApi
 
@@ -22,146 +32,358 @@ HF_USERNAME = os.environ.get("HF_USERNAME", "YOUR_HUGGINGFACE_USERNAME")
 HF_DATASET_NAME = "Dutch-European-Parliament-Minutes" # You can change this name if you like
 HF_REPO_ID = f"{HF_USERNAME}/{HF_DATASET_NAME}"
 
+# Download concurrency for Phase 2
+MAX_DOWNLOAD_WORKERS = 8
+
+# On-disk cache for the Phase 1 pages (europarl_terms.sqlite). Closed parliamentary terms no
+# longer change, so only the current term (and, less often, the previous one) is refetched.
+TERM_PAGES_CACHE_NAME = "europarl_terms"
+CURRENT_TERM_CACHE_TTL = timedelta(hours=1)
+PREVIOUS_TERM_CACHE_TTL = timedelta(days=7)
+CLOSED_TERM_CACHE_TTL = requests_cache.NEVER_EXPIRE
+
+# Extracted records are streamed to this parquet file in batches of RECORD_BATCH_SIZE
+NEW_RECORDS_PATH = "new_records.parquet"
+RECORD_BATCH_SIZE = 64
+RECORD_SCHEMA = pa.schema([
+    ("URL", pa.string()),
+    ("text", pa.string()),
+    ("source", pa.string()),
+])
+
+# Cache of HTTP validators (ETag / Last-Modified) per XML URL, used for conditional downloads
+ETAG_CACHE_PATH = "etag_cache.json"
+# Returned by download_content when the server answers 304 Not Modified
+NOT_MODIFIED = object()
+
+# Default headers sent with every request of the shared session. The minutes XML compresses
+# very well, so ask for compressed responses: gzip/deflate always, plus brotli (br) when the
+# brotli package is installed for urllib3 to decode it. requests decompresses transparently.
+SESSION_HEADERS = {
+    "User-Agent": "europarl-scraper/1.0",
+    "Accept-Encoding": requests.utils.DEFAULT_ACCEPT_ENCODING,
+}
+
 # Define the XML namespaces for lxml parsing
 NAMESPACES = {
     'text': "http://openoffice.org/2000/text",
     'table': "http://openoffice.org/2000/table",
 }
 
+# Top-level sections of the minutes XML that contain narrative content
+RELEVANT_SECTIONS = [
+    "PV.Other.Text",
+    "PV.Debate.Text",
+    "PV.Vote.Text",
+    "PV.Sitting.Resumption.Text",
+    "PV.Approval.Text",
+    "PV.Agenda.Text",
+    "PV.Sitting.Closure.Text",
+]
+
+# XPath expressions used by extract_dutch_text_from_xml, compiled once instead of per call.
+# Paragraphs inside <table:table> (which often contains lists/legends) are excluded up front.
+_SECTION_PARAGRAPHS_XP = etree.XPath(".//text:p[not(ancestor::table:table)]", namespaces=NAMESPACES)
+_STRING_XP = etree.XPath("string()")
+_ORATOR_LIST_XP = etree.XPath("./Orator.List.Text")
+_ATTENDANCE_NAME_XP = etree.XPath("./Attendance.Participant.Name")
+_ORATOR_LIST_STRING_XP = etree.XPath("string(./Orator.List.Text)")
+
+# CSS selectors for the archive HTML pages
+TERM_OPTIONS_SELECTOR = "select#criteriaSidesLeg option"
+# Links to XML documents, filtered for the specific 'XML' link classes within the structure observed
+XML_LINKS_SELECTOR = 'a.nopadding[href$=".xml"], a.link_simple_iconsmall[href$=".xml"]'
+
+# Matches a word of at least five letters, used to keep short but substantive paragraphs
+_WORD_RE = re.compile(r'[a-zA-Z]{5,}')
+
+# Remove XML-like tags (e.g., <text:line-break /> that might survive string() if not handled by lxml)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Remove excessive whitespace, including newlines, tabs, and multiple spaces
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Bracketed notes and references removed by clean_text, innermost first: the fixed-shape ones
+# often appear nested inside the longer notes, which then match up to their own closing
+# bracket rather than an inner one. Short notes like "(debat)" also appear inside rule references.
+_SHORT_NOTE_RE = re.compile(r'\((?:debat|stemming|vraag|interventie)\)', re.IGNORECASE)
+
+# The reference and note groups are each fused into a single alternation (case-insensitive
+# patterns scoped with (?i:...)) so the text is scanned once per group instead of once per
+# pattern. The leading lookahead on the possible first characters lets the engine skip all
+# other positions without trying each branch.
+_REFERENCE_PATTERNS = [
+    # Remove rule references
+    r'(?i:(\(|\[)\s*(?:(?:[a-zA-Z]{2,3})\s*(?:|\s|))?\s*(?:artikel|rule|punt|item)\s*\d+(?:,\s*lid\s*\d+)?\s*(?:\s+\w+)?\s*(\)|\]))',
+
+    # Remove reference texts (like document references)
+    r'\[(COM|A)\d+-\d+(/\d+)?\]',
+    r'\[\s*\d{4}/\d{4}\(COD\)\]',
+    r'\[\s*\d{4}/\d{4}\(INI\)\]',
+    r'\[\s*\d{4}/\d{4}\(RSP\)\]',
+    r'\[\s*\d{4}/\d{4}\(IMM\)\]',
+    r'\[\s*\d{4}/\d{4}\(NLE\)\]',
+    r'\[\s*\d{5}/\d{4}\s*-\s*C\d+-\d+/\d+\s*-\s*\d{4}/\d{4}\(NLE\)\]',
+
+    r'\(“Stemmingsuitslagen”, punt \d+\)',
+]
+_REFERENCE_RE = re.compile(r'(?=[(\[])(?:' + "|".join(f"(?:{pattern})" for pattern in _REFERENCE_PATTERNS) + ')')
+
+# Open-ended procedural notes (common patterns in English/Dutch minutes), matched up to the
+# first closing bracket once the references inside them are gone
+_NOTE_PATTERNS = [
+    r'(?i:\(The sitting (?:was suspended|opened|closed|ended) at.*?\))',
+    r'(?i:\(Voting time ended at.*?\))',
+    r'(?i:\(Het woord wordt gevoerd door:.*?\))',
+    r'\(de Voorzitter(?: maakt na de toespraak van.*?| weigert in te gaan op.*?| stemt toe| herinnert eraan dat de gedragsregels moeten worden nageleefd| neemt er akte van|)\)',
+    r'(?i:\(zie bijlage.*?\))',
+    r'\(\s*De vergadering wordt om.*?geschorst\.\)',
+    r'\(\s*De vergadering wordt om.*?hervat\.\)',
+]
+_NOTE_RE = re.compile(r'(?=\()(?:' + "|".join(f"(?:{pattern})" for pattern in _NOTE_PATTERNS) + ')')
+
+# Links run up to and including the next ')', which is often the one closing a note around
+# them, so they are removed after the notes: those then still end at the link's bracket
+_LINK_RE = re.compile(r'\(?(?:http|https):\/\/[^\s]+?\)')
+
+# Sentence-level procedural notes, applied in order after the bracketed ones since they end at
+# the first '.'. They are kept as separate passes: each starts with a literal prefix, which the
+# regex engine searches for much faster than it can try an alternation at every position.
+# The prefix is stored alongside so a pass can be skipped when the prefix does not occur at all.
+_SENTENCE_RULES = [
+    ("Volgens de “catch the eye”-procedure", re.compile(r'Volgens de “catch the eye”-procedure wordt het woord gevoerd door.*?\.')),
+    ("Het woord wordt gevoerd door ", re.compile(r'Het woord wordt gevoerd door .*?\.')),
+    ("De vergadering wordt om ", re.compile(r'De vergadering wordt om \d{1,2}\.\d{2} uur gesloten.')),
+    ("De vergadering wordt om ", re.compile(r'De vergadering wordt om \d{1,2}\.\d{2} uur geopend.')),
+    ("Het debat wordt gesloten", re.compile(r'Het debat wordt gesloten.')),
+    ("Stemming:", re.compile(r'Stemming:.*?\.')),
+]
+
+# Remove remaining multiple spaces left behind by the removals
+_MULTI_SPACE_RE = re.compile(r'\s{2,}')
+
 # --- Utility Functions ---
 
-def download_content(url, session):
-    """Downloads content from the given URL using a requests session."""
+def make_session(cached=False):
+    """
+    Creates a requests session. Its connection pool is sized for the download workers so
+    connections to europarl.europa.eu are kept alive and reused. With cached=True it is a
+    requests_cache session storing the Phase 1 pages (including the term form POSTs) on disk.
+    Instead of a fixed delay per request, requests are only slowed down when the server
+    pushes back: rate limiting and server errors are retried with exponential backoff,
+    honouring any Retry-After header.
+    """
+    if cached:
+        session = requests_cache.CachedSession(
+            TERM_PAGES_CACHE_NAME,
+            allowable_methods=("GET", "POST"),
+            expire_after=CURRENT_TERM_CACHE_TTL,
+        )
+    else:
+        session = requests.Session()
+    session.headers.update(SESSION_HEADERS)
+    retries = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_DOWNLOAD_WORKERS, max_retries=retries)
+    session.mount("https://", adapter)
+    return session
+
+def download_response(url, session, validators=None):
+    """
+    Downloads the given URL using a requests session and returns the response, or None on error.
+    If cached validators (ETag / Last-Modified) are given, the request is made conditional on
+    them and NOT_MODIFIED is returned on a 304.
+    """
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
     try:
-        response = session.get(url, timeout=20)
+        response = session.get(url, timeout=20, headers=headers)
+        if response.status_code == 304:
+            return NOT_MODIFIED
         response.raise_for_status() # Raise an HTTPError for bad responses (4xx or 5xx)
-        return response.content
+        return response
     except requests.exceptions.RequestException as e:
         print(f"Error downloading {url}: {e}")
         return None
 
+def download_content(url, session):
+    """Downloads content from the given URL using a requests session."""
+    response = download_response(url, session)
+    return response.content if response is not None else None
+
+def load_etag_cache(path):
+    """Loads the URL -> HTTP validators cache, or returns an empty one if there is none yet."""
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+
+def save_etag_cache(etag_cache, path):
+    """Saves the URL -> HTTP validators cache for the next run. Does nothing if it is disabled (None)."""
+    if etag_cache is None:
+        return
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(etag_cache))
+    print(f"Saved HTTP validators for {len(etag_cache)} XML URLs to '{path}'.")
+
 def extract_xml_links_from_html(html_content):
     """
-    Parses HTML content to extract all unique XML document links.
+    Parses HTML content (raw bytes or text) to extract all unique XML document links.
     """
-    soup = BeautifulSoup(html_content, 'lxml')
+    tree = LexborHTMLParser(html_content)
     xml_links = set()
 
-    for a_tag in soup.find_all('a', href=re.compile(r'\.xml$')):
-        # Filter for specific 'XML' links within the structure observed
-        if 'nopadding' in a_tag.get('class', []) or 'link_simple_iconsmall' in a_tag.get('class', []):
-            href = a_tag['href']
-            full_url = urljoin(BASE_DOC_URL, href)
-            xml_links.add(full_url)
+    for a_tag in tree.css(XML_LINKS_SELECTOR):
+        full_url = urljoin(BASE_DOC_URL, a_tag.attributes['href'])
+        xml_links.add(full_url)
     return list(xml_links)
 
-def get_all_archive_xml_links():
+def term_cache_ttl(term_value, current_term):
+    """Returns how long the result page of a parliamentary term may be served from the cache."""
+    if not term_value.isdigit() or current_term is None:
+        return CURRENT_TERM_CACHE_TTL
+    terms_ago = current_term - int(term_value)
+    if terms_ago <= 0:
+        return CURRENT_TERM_CACHE_TTL
+    if terms_ago == 1:
+        return PREVIOUS_TERM_CACHE_TTL
+    return CLOSED_TERM_CACHE_TTL
+
+def get_all_archive_xml_links(session):
     """
-    Navigates the Europarl archive by parliamentary term and collects all XML links.
+    Navigates the Europarl archive by parliamentary term and collects all Dutch (_NL.xml) XML links.
     """
     all_xml_urls = set()
     
-    with requests.Session() as session:
-        # Get the main page to find the parliamentary terms dropdown
-        print("Fetching main minutes page to identify parliamentary terms...")
-        html_content_main = download_content(BASE_MINUTES_URL, session)
-        if not html_content_main:
-            print("Failed to fetch main minutes page.")
-            return []
-
-        soup_main = BeautifulSoup(html_content_main, 'lxml')
-
-        term_select = soup_main.find('select', id='criteriaSidesLeg')
-        if not term_select:
-            print("Could not find the parliamentary term dropdown. Check HTML structure.")
-            return []
-
-        parliamentary_terms = []
-        for option in term_select.find_all('option'):
-            term_value = option.get('value')
-            term_title = option.get('title')
-            if term_value and term_title:
-                parliamentary_terms.append((term_value, term_title))
+    # Get the main page to find the parliamentary terms dropdown
+    print("Fetching main minutes page to identify parliamentary terms...")
+    html_content_main = download_content(BASE_MINUTES_URL, session)
+    if not html_content_main:
+        print("Failed to fetch main minutes page.")
+        return []
+
+    tree_main = LexborHTMLParser(html_content_main)
+
+    term_options = tree_main.css(TERM_OPTIONS_SELECTOR)
+    if not term_options:
+        print("Could not find the parliamentary term dropdown. Check HTML structure.")
+        return []
+
+    parliamentary_terms = []
+    for option in term_options:
+        term_value = option.attributes.get('value')
+        term_title = option.attributes.get('title')
+        if term_value and term_title:
+            parliamentary_terms.append((term_value, term_title))
+    
+    print(f"Found {len(parliamentary_terms)} parliamentary terms: {parliamentary_terms}")
+    numeric_terms = [int(term_value) for term_value, _ in parliamentary_terms if term_value.isdigit()]
+    current_term = max(numeric_terms, default=None)
+
+    for term_value, term_title in tqdm(parliamentary_terms, desc="Collecting XML Links by Term"):
+        # print(f"\nProcessing term: {term_title} (Value: {term_value})") # Commented for cleaner tqdm output
         
-        print(f"Found {len(parliamentary_terms)} parliamentary terms: {parliamentary_terms}")
-
-        for term_value, term_title in tqdm(parliamentary_terms, desc="Collecting XML Links by Term"):
-            # print(f"\nProcessing term: {term_title} (Value: {term_value})") # Commented for cleaner tqdm output
-            
-            # Simulate form submission to get minutes for this term
-            form_data = {
-                'clean': 'false', 'legChange': 'false', 'source': '', 'dateSys': '',
-                'tabActif': 'tabResult', 'leg': term_value,
-                'refSittingDateStart': '', 'refSittingDateEnd': '',
-                'miType': 'text', 'miText': '', 'sortResults': ''
-            }
-
-            try:
-                term_response = session.post(BASE_MINUTES_URL, data=form_data, timeout=30)
-                term_response.raise_for_status()
-            except requests.exceptions.RequestException as e:
-                print(f"Error submitting form for term {term_title}: {e}")
-                time.sleep(5)
-                continue
+        # Simulate form submission to get minutes for this term
+        form_data = {
+            'clean': 'false', 'legChange': 'false', 'source': '', 'dateSys': '',
+            'tabActif': 'tabResult', 'leg': term_value,
+            'refSittingDateStart': '', 'refSittingDateEnd': '',
+            'miType': 'text', 'miText': '', 'sortResults': ''
+        }
 
-            links_on_term_page = extract_xml_links_from_html(term_response.text)
-            initial_count = len(all_xml_urls)
-            all_xml_urls.update(links_on_term_page)
-            # print(f"  Found {len(all_xml_urls) - initial_count} new XML links for {term_title}. Total: {len(all_xml_urls)}") # Commented for cleaner tqdm output
+        try:
+            term_response = session.post(BASE_MINUTES_URL, data=form_data, timeout=30,
+                                         expire_after=term_cache_ttl(term_value, current_term))
+            term_response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"Error submitting form for term {term_title}: {e}")
+            time.sleep(5)
+            continue
+
+        # Pass the raw bytes: the parser decodes the UTF-8 page itself, skipping requests' charset detection
+        links_on_term_page = extract_xml_links_from_html(term_response.content)
+        initial_count = len(all_xml_urls)
+        # Only keep the Dutch documents, so no other language is ever downloaded
+        all_xml_urls.update(url for url in links_on_term_page if url.endswith("_NL.xml"))
+        # print(f"  Found {len(all_xml_urls) - initial_count} new XML links for {term_title}. Total: {len(all_xml_urls)}") # Commented for cleaner tqdm output
+        if not getattr(term_response, "from_cache", False):
             time.sleep(1) # Be polite, add a small delay between term requests
 
     return list(all_xml_urls)
 
-def clean_text(text):
-    """Applies common text cleaning rules."""
-    # Remove XML-like tags (e.g., <text:line-break /> that might survive string() if not handled by lxml)
-    text = re.sub(r'<[^>]+>', '', text)
-    
-    # Remove excessive whitespace, including newlines, tabs, and multiple spaces
-    text = re.sub(r'\s+', ' ', text).strip()
-
-    # Remove procedural notes (common patterns in English/Dutch minutes)
-    text = re.sub(r'\(The sitting (?:was suspended|opened|closed|ended) at.*?\)', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\(Voting time ended at.*?\)', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\((?:debat|stemming|vraag|interventie)\)', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\(Het woord wordt gevoerd door:.*?\)', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'(\(|\[)\s*(?:(?:[a-zA-Z]{2,3})\s*(?:|\s|))?\s*(?:artikel|rule|punt|item)\s*\d+(?:,\s*lid\s*\d+)?\s*(?:\s+\w+)?\s*(\)|\])', '', text, flags=re.IGNORECASE)
-    
-    # Remove reference texts (like links, document references)
-    text = re.sub(r'\[(COM|A)\d+-\d+(/\d+)?\]', '', text)
-    text = re.sub(r'\(?(?:http|https):\/\/[^\s]+?\)', '', text)
-    text = re.sub(r'\[\s*\d{4}/\d{4}\(COD\)\]', '', text)
-    text = re.sub(r'\[\s*\d{4}/\d{4}\(INI\)\]', '', text)
-    text = re.sub(r'\[\s*\d{4}/\d{4}\(RSP\)\]', '', text)
-    text = re.sub(r'\[\s*\d{4}/\d{4}\(IMM\)\]', '', text)
-    text = re.sub(r'\[\s*\d{4}/\d{4}\(NLE\)\]', '', text)
-    text = re.sub(r'\[\s*\d{5}/\d{4}\s*-\s*C\d+-\d+/\d+\s*-\s*\d{4}/\d{4}\(NLE\)\]', '', text)
-    
-    text = re.sub(r'\(“Stemmingsuitslagen”, punt \d+\)', '', text)
-    text = re.sub(r'\(de Voorzitter(?: maakt na de toespraak van.*?| weigert in te gaan op.*?| stemt toe| herinnert eraan dat de gedragsregels moeten worden nageleefd| neemt er akte van|)\)', '', text)
-    text = re.sub(r'\(zie bijlage.*?\)', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\(\s*De vergadering wordt om.*?geschorst\.\)', '', text)
-    text = re.sub(r'\(\s*De vergadering wordt om.*?hervat\.\)', '', text)
-    text = re.sub(r'Volgens de “catch the eye”-procedure wordt het woord gevoerd door.*?\.', '', text)
-    text = re.sub(r'Het woord wordt gevoerd door .*?\.', '', text)
-    text = re.sub(r'De vergadering wordt om \d{1,2}\.\d{2} uur gesloten.', '', text)
-    text = re.sub(r'De vergadering wordt om \d{1,2}\.\d{2} uur geopend.', '', text)
-    text = re.sub(r'Het debat wordt gesloten.', '', text)
-    text = re.sub(r'Stemming:.*?\.', '', text)
-
-    # Remove remaining multiple spaces and strip leading/trailing whitespace
-    text = re.sub(r'\s{2,}', ' ', text).strip()
-    
-    return text
+def clean_text(text, whitespace_collapsed=False):
+    """
+    Applies common text cleaning rules.
+    Pass whitespace_collapsed=True when whitespace runs were already collapsed to single spaces
+    (as extract_section_texts does per paragraph) to skip that pass over the whole text.
+    """
+    text, tag_count = _TAG_RE.subn('', text)
+    # Removed tags may leave whitespace runs behind, so collapse them in that case regardless
+    if tag_count or not whitespace_collapsed:
+        text = _WHITESPACE_RE.sub(' ', text).strip()
+    text = _SHORT_NOTE_RE.sub('', text)
+    text = _REFERENCE_RE.sub('', text)
+    text = _NOTE_RE.sub('', text)
+    text = _LINK_RE.sub('', text)
+    for prefix, pattern in _SENTENCE_RULES:
+        if prefix in text:
+            text = pattern.sub('', text)
+    return _MULTI_SPACE_RE.sub(' ', text).strip()
+
+def extract_section_texts(section):
+    """Returns the substantive paragraph texts of a single section element."""
+    section_texts = []
+    for p_tag in _SECTION_PARAGRAPHS_XP(section):
+        text_content = _STRING_XP(p_tag).strip()
+        
+        if text_content:
+            # Check if it's primarily a list of names (common in <Orator.List.Text>)
+            if _ORATOR_LIST_XP(p_tag) or _ATTENDANCE_NAME_XP(p_tag):
+                name_list_text = _ORATOR_LIST_STRING_XP(p_tag).strip()
+                if len(text_content) < 100 and name_list_text and name_list_text == text_content:
+                    continue
+
+            # Additional filtering for very short or non-substantive text
+            if len(text_content) < 20 and not _WORD_RE.search(text_content):
+                continue
+
+            # Collapse whitespace while the paragraph is small, rather than over the joined document
+            section_texts.append(" ".join(text_content.split()))
+    return section_texts
 
 def extract_dutch_text_from_xml(xml_content):
     """
-    Parses XML content using lxml and extracts relevant Dutch text.
+    Stream-parses XML content using lxml and extracts relevant Dutch text.
     Assumes the XML file is already identified as Dutch via its URL (_NL.xml).
     """
+    # Texts are grouped per section type and joined in RELEVANT_SECTIONS order
+    texts_by_section = {section_name: [] for section_name in RELEVANT_SECTIONS}
+
     try:
-        parser = etree.XMLParser(recover=True, ns_clean=True)
-        root = etree.fromstring(xml_content, parser=parser)
+        # Only the end of relevant sections is reported, at which point the section is complete.
+        # ID collection and entity resolution are not needed and are disabled for speed and safety.
+        for _, section in etree.iterparse(BytesIO(xml_content), events=("end",), tag=RELEVANT_SECTIONS, recover=True,
+                                          collect_ids=False, resolve_entities=False, load_dtd=False, no_network=True):
+            # A section nested in one of the same type is covered when the outer one ends
+            if next(section.iterancestors(section.tag), None) is None:
+                texts_by_section[section.tag].extend(extract_section_texts(section))
+
+            # Free the processed section and everything before it, unless it is nested in another
+            # relevant section which still needs these paragraphs once it ends
+            if next(section.iterancestors(*RELEVANT_SECTIONS), None) is None:
+                section.clear(keep_tail=True)
+                while section.getprevious() is not None:
+                    del section.getparent()[0]
     except etree.XMLSyntaxError as e:
         # print(f"LXML XMLSyntaxError: {e}")
         return None
@@ -169,70 +391,62 @@ def extract_dutch_text_from_xml(xml_content):
         # print(f"Unexpected LXML parsing error: {e}")
         return None
 
-    dutch_texts = []
-
-    # Iterate over specific top-level sections that contain narrative content
-    relevant_sections = [
-        "PV.Other.Text",
-        "PV.Debate.Text",
-        "PV.Vote.Text",
-        "PV.Sitting.Resumption.Text",
-        "PV.Approval.Text",
-        "PV.Agenda.Text",
-        "PV.Sitting.Closure.Text",
-    ]
-
-    for section_name in relevant_sections:
-        xpath_query = f"//{section_name}//text:p"
-        
-        for p_tag in root.xpath(xpath_query, namespaces=NAMESPACES):
-            text_content = p_tag.xpath("string()").strip()
-            
-            if text_content:
-                # Exclude content from within <table:table> which often contains lists/legends
-                if p_tag.xpath("ancestor::table:table", namespaces=NAMESPACES):
-                    continue
-                
-                # Check if it's primarily a list of names (common in <Orator.List.Text>)
-                if p_tag.xpath("./Orator.List.Text", namespaces=NAMESPACES) or \
-                   p_tag.xpath("./Attendance.Participant.Name", namespaces=NAMESPACES):
-                    name_list_text = p_tag.xpath("string(./Orator.List.Text)", namespaces=NAMESPACES).strip()
-                    if len(text_content) < 100 and name_list_text and name_list_text == text_content:
-                        continue
-
-                # Additional filtering for very short or non-substantive text
-                if len(text_content) < 20 and not re.search(r'[a-zA-Z]{5,}', text_content):
-                    continue
-
-                dutch_texts.append(text_content)
-
-    final_text = clean_text("\n".join(dutch_texts))
+    dutch_texts = [text for section_name in RELEVANT_SECTIONS for text in texts_by_section[section_name]]
+    final_text = clean_text(" ".join(dutch_texts), whitespace_collapsed=True)
     
     return final_text if final_text and len(final_text) > 50 else None # Minimum length for final text
 
-def process_and_extract_data(xml_urls):
+def fetch_and_extract(url, session, etag_cache):
     """
-    Processes a list of XML URLs, extracts Dutch text, and returns structured data.
+    Downloads a single XML document and returns its record, or None if nothing was extracted
+    (including when the document is unchanged since it last yielded nothing).
+    If etag_cache is a dict, the download is conditional on the validators cached for the URL.
     """
-    processed_data = []
-    
-    with requests.Session() as session:
-        for url in tqdm(xml_urls, desc="Extracting Dutch Text from URLs"):
-            # Skip non-Dutch XMLs if they somehow got into the list (shouldn't happen with updated scraper)
-            if "_NL.xml" not in url:
-                continue
+    validators = etag_cache.get(url) if etag_cache is not None else None
+    response = download_response(url, session, validators)
+    if response is NOT_MODIFIED or response is None or not response.content:
+        return None
+    text = extract_dutch_text_from_xml(response.content)
+    if not text:
+        # Only documents without a record are cached. Published ones are skipped by the URL
+        # dedup instead, and must be downloaded again whenever that dedup is unavailable.
+        if etag_cache is not None:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                etag_cache[url] = {"etag": etag, "last_modified": last_modified}
+        return None
+    return {
+        "URL": url,
+        "text": text,
+        "source": "European Parliament Minutes"
+    }
 
-            xml_content = download_content(url, session)
-            if xml_content:
-                text = extract_dutch_text_from_xml(xml_content)
-                if text:
-                    processed_data.append({
-                        "URL": url,
-                        "text": text,
-                        "source": "European Parliament Minutes"
-                    })
-            time.sleep(0.1) # Small delay to be polite to the server
-    return processed_data
+def process_and_extract_data(xml_urls, session, output_path, etag_cache):
+    """
+    Processes a list of XML URLs, extracts Dutch text, and writes the structured records to
+    a parquet file at output_path in small batches. Returns the number of records written.
+    Downloads and parsing run in a thread pool sharing one session. If etag_cache is a dict,
+    downloads are conditional on its validators, which the workers record for documents that
+    yield no record; pass None to download everything unconditionally.
+    """
+    record_count = 0
+    batch = []
+    with pq.ParquetWriter(output_path, RECORD_SCHEMA) as writer, \
+            ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+        # executor.map drops each result once yielded, so only the current batch is kept in memory
+        records = executor.map(partial(fetch_and_extract, session=session, etag_cache=etag_cache), xml_urls)
+        for record in tqdm(records, total=len(xml_urls), desc="Extracting Dutch Text from URLs"):
+            if record:
+                batch.append(record)
+            if len(batch) >= RECORD_BATCH_SIZE:
+                writer.write_table(pa.Table.from_pylist(batch, schema=RECORD_SCHEMA))
+                record_count += len(batch)
+                batch = []
+        if batch:
+            writer.write_table(pa.Table.from_pylist(batch, schema=RECORD_SCHEMA))
+            record_count += len(batch)
+    return record_count
 
 def load_existing_dataset(repo_id):
     """Loads an existing dataset from Hugging Face Hub, handling potential errors."""
@@ -259,61 +473,90 @@ def main():
         print("Set it as an environment variable (e.g., in GitHub Secrets) or run 'huggingface-cli login' locally.")
         return # Exit if no token is available
 
-    # Step 1: Collect all XML URLs
-    print("\n--- Phase 1: Collecting XML URLs ---")
-    all_xml_urls = get_all_archive_xml_links()
-    if not all_xml_urls:
-        print("No XML URLs collected. Exiting.")
-        return
-    print(f"Collected {len(all_xml_urls)} potential XML URLs.")
-
-    # Save scraped URLs to a file for artifact upload (for debugging/audit)
-    with open("europarl_xml_urls.txt", "w", encoding="utf-8") as f:
-        for url in all_xml_urls:
-            f.write(url + "\n")
-    print("XML URLs saved to 'europarl_xml_urls.txt' artifact.")
-
-    # Step 2: Process and Extract Dutch Text
-    print("\n--- Phase 2: Extracting Dutch Content ---")
-    newly_scraped_data = process_and_extract_data(all_xml_urls)
-    if not newly_scraped_data:
-        print("No Dutch text extracted from collected URLs. Exiting.")
-        return
-    print(f"Successfully extracted {len(newly_scraped_data)} new records with Dutch text.")
-
-    # Save processed data to a file for artifact upload (for debugging/audit)
-    with open("europarl_dutch_data_sample.json", "w", encoding="utf-8") as f:
-        json.dump(newly_scraped_data, f, ensure_ascii=False, indent=2)
+    # One session (and its pool of kept-alive connections) is shared by all XML downloads
+    with make_session() as session:
+        # Step 1: Collect all XML URLs
+        print("\n--- Phase 1: Collecting XML URLs ---")
+        # The term pages go through an on-disk cache, so closed terms are not fetched again
+        with make_session(cached=True) as term_pages_session:
+            all_xml_urls = get_all_archive_xml_links(term_pages_session)
+        if not all_xml_urls:
+            print("No XML URLs collected. Exiting.")
+            return
+        print(f"Collected {len(all_xml_urls)} potential XML URLs.")
+
+        # Save scraped URLs to a file for artifact upload (for debugging/audit)
+        with open("europarl_xml_urls.txt", "w", encoding="utf-8") as f:
+            for url in all_xml_urls:
+                f.write(url + "\n")
+        print("XML URLs saved to 'europarl_xml_urls.txt' artifact.")
+
+        # Step 2: Process and Extract Dutch Text
+        print("\n--- Phase 2: Extracting Dutch Content ---")
+
+        # Only download sittings that are not in the Hub dataset yet, so incremental runs
+        # scale with the number of new sittings instead of the whole archive
+        existing_dataset = load_existing_dataset(HF_REPO_ID)
+        if existing_dataset is not None:
+            existing_urls = set(pc.unique(existing_dataset.data.column("URL")).to_pylist())
+            new_xml_urls = [url for url in all_xml_urls if url not in existing_urls]
+            print(f"Skipping {len(all_xml_urls) - len(new_xml_urls)} XML URLs already in '{HF_REPO_ID}'.")
+            if not new_xml_urls:
+                print("No new XML URLs found since the last run. Dataset is up to date.")
+                return
+            all_xml_urls = new_xml_urls
+
+        # Documents that did not yield a record last time are typically unchanged and answer
+        # with a 304. The cache is only saved once a run's records are safely on the Hub, so a
+        # failed upload never causes unpublished sittings to be skipped on the next run.
+        # Without the existing dataset (first run, or it failed to load) every document is
+        # downloaded unconditionally, so the pushed dataset is always the complete archive.
+        etag_cache = load_etag_cache(ETAG_CACHE_PATH) if existing_dataset is not None else None
+        record_count = process_and_extract_data(all_xml_urls, session, NEW_RECORDS_PATH, etag_cache)
+        if not record_count:
+            print("No Dutch text extracted from collected URLs. Exiting.")
+            save_etag_cache(etag_cache, ETAG_CACHE_PATH)
+            return
+        print(f"Successfully extracted {record_count} new records with Dutch text to '{NEW_RECORDS_PATH}'.")
+
+    # Load the new records as a Dataset object, straight from the parquet file
+    new_data_dataset = Dataset.from_parquet(NEW_RECORDS_PATH)
+
+    # Save processed data to a file for artifact upload (for debugging/audit). The JSON array is
+    # written record by record, so the records are never all held as Python objects at once.
+    with open("europarl_dutch_data_sample.json", "wb") as f:
+        f.write(b"[")
+        separator = b""
+        for record_batch in new_data_dataset.data.table.to_batches(max_chunksize=RECORD_BATCH_SIZE):
+            for record in record_batch.to_pylist():
+                f.write(separator + orjson.dumps(record))
+                separator = b","
+        f.write(b"]")
     print("Processed Dutch data saved to 'europarl_dutch_data_sample.json' artifact.")
 
     # Step 3: Prepare for Hugging Face Upload (Incremental Update)
     print("\n--- Phase 3: Preparing for Hugging Face Upload (Incremental Update) ---")
-    
-    existing_dataset = load_existing_dataset(HF_REPO_ID)
-    
-    # Convert new data to a Dataset object
-    new_data_dataset = Dataset.from_list(newly_scraped_data)
 
     combined_dataset_to_push = None
 
     if existing_dataset is not None:
-        # Create a set of existing URLs for efficient lookup
-        existing_urls = set(existing_dataset["URL"])
-        
-        # Filter out records that are already in the existing dataset
-        def is_new_record(record):
-            return record["URL"] not in existing_urls
-
-        filtered_new_data = new_data_dataset.filter(is_new_record)
-
-        if len(filtered_new_data) > 0:
-            print(f"Found {len(filtered_new_data)} truly new records to add.")
-            # Concatenate existing data with new data
-            combined_dataset_to_push = DatasetDict({
-                'train': existing_dataset.concatenate(filtered_new_data)
-            })
+        # Work on the underlying Arrow tables directly, without going through the Dataset wrapper
+        existing_table = existing_dataset.data.table
+        new_table = new_data_dataset.data.table
+
+        # Filter out records that are already in the existing dataset, using an Arrow mask
+        # rather than a per-row Python callback
+        is_existing = pc.is_in(new_table.column("URL"), value_set=pc.unique(existing_table.column("URL")))
+        filtered_new_table = new_table.filter(pc.invert(is_existing))
+
+        if filtered_new_table.num_rows > 0:
+            print(f"Found {filtered_new_table.num_rows} truly new records to add.")
+            # Concatenate existing data with new data, unifying the schemas by column name
+            combined_table = pa.concat_tables([existing_table, filtered_new_table], promote_options="default")
+            combined_dataset_to_push = DatasetDict({'train': Dataset(combined_table)})
         else:
             print("No new records found since the last run. Dataset is up to date.")
+            save_etag_cache(etag_cache, ETAG_CACHE_PATH)
             return # Exit if nothing new to push
     else:
         print(f"No existing dataset '{HF_REPO_ID}' found. Creating a new one.")
@@ -336,6 +579,7 @@ def main():
         # Push the dataset. The library handles updating if it exists.
         combined_dataset_to_push.push_to_hub(HF_REPO_ID, private=False) # Set private=True if desired
         print(f"Dataset successfully pushed/updated to https://huggingface.co/datasets/{HF_REPO_ID}")
+        save_etag_cache(etag_cache, ETAG_CACHE_PATH)
     except Exception as e:
         print(f"Error pushing dataset to Hugging Face Hub: {e}")
         print("Please ensure your HF_TOKEN has 'write' access and HF_USERNAME is correct.")